@@ -66,7 +66,8 @@ def describe_instances(cache, session):
                         "stopped" 
                     ]
                 }
-            ]
+            ],
+            PaginationConfig={"PageSize": 1000}
         ):
         for r in page["Reservations"]:
             for i in r["Instances"]:
@@ -86,8 +87,8 @@ def describe_instances(cache, session):
                 i["ManagedInstanceInformation"] = managedInstanceInfo
                 instanceList.append(i)
 
-        cache["describe_instances"] = instanceList
-        return cache["describe_instances"]
+    cache["describe_instances"] = instanceList
+    return cache["describe_instances"]
 
 def describe_elastic_ips(cache, session):
     response = cache.get("describe_elastic_ips")
@@ -39,7 +39,11 @@ def describe_load_balancers(cache, session):
     
     elbv2 = session.client("elbv2")
 
-    cache["describe_load_balancers"] = elbv2.describe_load_balancers()["LoadBalancers"]
+    loadBalancers = []
+    for page in elbv2.get_paginator("describe_load_balancers").paginate(PaginationConfig={"PageSize": 400}):
+        loadBalancers.extend(page["LoadBalancers"])
+
+    cache["describe_load_balancers"] = loadBalancers
     return cache["describe_load_balancers"]
 
 SHODAN_HOSTS_URL = "https://api.shodan.io/shodan/host/"
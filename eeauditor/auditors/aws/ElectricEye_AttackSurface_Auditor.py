@@ -18,12 +18,18 @@
 #specific language governing permissions and limitations
 #under the License.
 
+import os
 import nmap3
 import datetime
 from check_register import CheckRegister
-from dateutil.parser import parse
 import base64
 import json
+from operator import itemgetter
+import subprocess
+import tempfile
+import socket
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from botocore.config import Config
 
 # Adding backoff and retries for SSM - this API gets throttled a lot
@@ -36,8 +42,140 @@ config = Config(
 
 registry = CheckRegister()
 
-# Instantiate a NMAP scanner for TCP scans to define ports
-nmap = nmap3.NmapScanTechniques()
+# FTP, SSH, TelNet, SMTP, HTTP, POP3, NetBIOS, SMB, RDP, MSSQL, MySQL/MariaDB, NFS, Docker, Oracle, PostgreSQL, 
+# Kibana, VMWare, Proxy, Splunk, K8s, Redis, Kafka, Mongo, Rabbit/AmazonMQ, SparkUI
+NMAP_TCP_PORTS = "21,22,23,25,80,110,139,445,3389,1433,3306,2049,2375,1521,5432,5601,8182,8080,8089,10250,6379,9092,27017,5672,4040"
+
+# Services which NMAP does not name (or names generically) from its services table are named by port
+PORT_SERVICE_OVERRIDES = {
+    8089: "SPLUNKD",
+    10250: "KUBERNETES-API",
+    5672: "RABBITMQ",
+    4040: "SPARK-WEBUI"
+}
+
+# Shared by every open port finding, the checks only add the host and port specific fields
+ATTACK_SURFACE_FINDING_TYPES = [
+    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
+    "TTPs/Discovery"
+]
+
+ATTACK_SURFACE_RELATED_REQUIREMENTS = (
+    "NIST CSF V1.1 PR.AC-3",
+    "NIST SP 800-53 Rev. 4 AC-1",
+    "NIST SP 800-53 Rev. 4 AC-17",
+    "NIST SP 800-53 Rev. 4 AC-19",
+    "NIST SP 800-53 Rev. 4 AC-20",
+    "NIST SP 800-53 Rev. 4 SC-15",
+    "AICPA TSC CC6.6",
+    "ISO 27001:2013 A.6.2.1",
+    "ISO 27001:2013 A.6.2.2",
+    "ISO 27001:2013 A.11.2.6",
+    "ISO 27001:2013 A.13.1.1",
+    "ISO 27001:2013 A.13.2.1",
+    "MITRE ATT&CK T1040",
+    "MITRE ATT&CK T1046",
+    "MITRE ATT&CK T1580",
+    "MITRE ATT&CK T1590",
+    "MITRE ATT&CK T1592",
+    "MITRE ATT&CK T1595"
+)
+
+EC2_ATTACK_SURFACE_PRODUCT_FIELDS = {
+    "ProductName": "ElectricEye",
+    "Provider": "AWS",
+    "ProviderType": "CSP",
+    "AssetClass": "Compute",
+    "AssetService": "Amazon EC2",
+    "AssetComponent": "Instance"
+}
+
+EC2_ATTACK_SURFACE_FAILED_TEMPLATE = {
+    "SchemaVersion": "2018-10-08",
+    "Types": ATTACK_SURFACE_FINDING_TYPES,
+    "Severity": {"Label": "HIGH"},
+    "Confidence": 99,
+    "Remediation": {
+        "Recommendation": {
+            "Text": "EC2 Instances should only have the minimum necessary ports open to achieve their purposes, allow traffic from authorized sources, and use other defense-in-depth and hardening strategies. For a basic view on traffic authorization into your instances refer to the Authorize inbound traffic for your Linux instances section of the Amazon Elastic Compute Cloud User Guide",
+            "Url": "https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/authorizing-access-to-an-instance.html"
+        }
+    },
+    "Workflow": {"Status": "NEW"},
+    "RecordState": "ACTIVE"
+}
+
+EC2_ATTACK_SURFACE_PASSED_TEMPLATE = {
+    **EC2_ATTACK_SURFACE_FAILED_TEMPLATE,
+    "Severity": {"Label": "INFORMATIONAL"},
+    "Workflow": {"Status": "RESOLVED"},
+    "RecordState": "ARCHIVED"
+}
+
+ELBV2_ATTACK_SURFACE_PRODUCT_FIELDS = {
+    "ProductName": "ElectricEye",
+    "Provider": "AWS",
+    "ProviderType": "CSP",
+    "AssetClass": "Networking",
+    "AssetService": "AWS Elastic Load Balancer V2",
+    "AssetComponent": "Application Load Balancer"
+}
+
+ELBV2_ATTACK_SURFACE_FAILED_TEMPLATE = {
+    "SchemaVersion": "2018-10-08",
+    "Types": ATTACK_SURFACE_FINDING_TYPES,
+    "Severity": {"Label": "HIGH"},
+    "Confidence": 99,
+    "Remediation": {
+        "Recommendation": {
+            "Text": "For more information on ALB security group reccomendations refer to the Security groups for your Application Load Balancer section of the Application Load Balancers User Guide.",
+            "Url": "https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-update-security-groups.html#security-group-recommended-rules"
+        }
+    },
+    "Workflow": {"Status": "NEW"},
+    "RecordState": "ACTIVE"
+}
+
+ELBV2_ATTACK_SURFACE_PASSED_TEMPLATE = {
+    **ELBV2_ATTACK_SURFACE_FAILED_TEMPLATE,
+    "Severity": {"Label": "INFORMATIONAL"},
+    "Workflow": {"Status": "RESOLVED"},
+    "RecordState": "ARCHIVED"
+}
+
+# Asset specific finding strings for the shared open TCP port finding generator, these are formatted with the
+# assetName, checkIdNumber, portNumber, serviceName and serviceStateReason of each scanned port
+EC2_ATTACK_SURFACE_FINDING = {
+    "FailedTemplate": EC2_ATTACK_SURFACE_FAILED_TEMPLATE,
+    "PassedTemplate": EC2_ATTACK_SURFACE_PASSED_TEMPLATE,
+    "ProductFields": EC2_ATTACK_SURFACE_PRODUCT_FIELDS,
+    "Id": "attack-surface-ec2-open-{serviceName}-check",
+    "Title": "[AttackSurface.EC2.{checkIdNumber}] EC2 Instances should not be publicly reachable on {serviceName}",
+    "FailedDescription": "EC2 instance {assetName} is publicly reachable on port {portNumber} which corresponds to the {serviceName} service. When Services are successfully fingerprinted by the ElectricEye Attack Surface Management Auditor it means the instance is Public, has an open Secuirty Group rule, and a running service on the host which adversaries can also see. Refer to the remediation insturctions for an example of a way to secure EC2 instances.",
+    "PassedDescription": "EC2 instance {assetName} is not publicly reachable on port {portNumber} which corresponds to the {serviceName} service due to {serviceStateReason}. Instances and their respective Security Groups should still be reviewed for minimum necessary access."
+}
+
+ELBV2_ATTACK_SURFACE_FINDING = {
+    "FailedTemplate": ELBV2_ATTACK_SURFACE_FAILED_TEMPLATE,
+    "PassedTemplate": ELBV2_ATTACK_SURFACE_PASSED_TEMPLATE,
+    "ProductFields": ELBV2_ATTACK_SURFACE_PRODUCT_FIELDS,
+    "Id": "attack-surface-elbv2-open-{serviceName}-check",
+    "Title": "[AttackSurface.ELBv2.{checkIdNumber}] Application Load Balancers should not be publicly reachable on {serviceName}",
+    "FailedDescription": "Application load balancer {assetName} is publicly reachable on port {portNumber} which corresponds to the {serviceName} service. When Services are successfully fingerprinted by the ElectricEye Attack Surface Management Auditor it means the instance is Public, has an open Secuirty Group rule, and a running service on the host which adversaries can also see. Refer to the remediation insturctions for an example of a way to secure EC2 instances.",
+    "PassedDescription": "Application load balancer {assetName} is not publicly reachable on port {portNumber} which corresponds to the {serviceName} service due to {serviceStateReason}. ALBs and their respective Security Groups should still be reviewed for minimum necessary access."
+}
+
+# Set ELECTRICEYE_EMIT_PASS=false to only report open ports from the EC2 and ALB checks. Passing findings are what
+# archive a previously failing finding in Security Hub once the port is closed, so they are emitted by default
+EMIT_PASS_FINDINGS = os.environ.get("ELECTRICEYE_EMIT_PASS", "true").lower() == "true"
+
+# NMAP runs as a subprocess so scans are I/O bound and can overlap across threads, each NMAP process
+# is given a batch of hosts so that process startup is amortized and NMAP's own host parallelism is used
+NMAP_MAX_WORKERS = 16
+NMAP_BATCH_SIZE = 64
+
+# nmap3 scanner for the single host scans, only created once a check needs it
+nmap = None
 
 def global_region_generator(awsPartition):
     # Global Service Region override
@@ -58,15 +196,19 @@ def global_region_generator(awsPartition):
 
     return globalRegion
 
-def describe_instances(cache, session):
-    response = cache.get("describe_instances")
-    if response:
-        return response
-    
-    instanceList = []
-    
-    ec2 = session.client("ec2")
-    ssm = session.client("ssm", config=config)
+def get_client(cache, session, serviceName, clientConfig=None):
+    # The checks here span several services, so clients are kept per service name
+    client = cache.get(f"{serviceName}_client")
+    if client:
+        return client
+    cache[f"{serviceName}_client"] = session.client(serviceName, config=clientConfig)
+    return cache[f"{serviceName}_client"]
+
+def iter_public_instances(cache, session):
+    # Only instances with a public IP can be scanned, so EC2 filters out the rest. Instances are yielded as each
+    # page arrives so scans can start while later pages are listed, only the EC2 check reads these so nothing is cached
+    ec2 = get_client(cache, session, "ec2")
+    ssm = get_client(cache, session, "ssm", config)
     # Enrich EC2 with SSM details - this is done for the EC2 Auditor - all others using EC2 don't matter too much
     managedInstances = ssm.describe_instance_information()["InstanceInformationList"]
 
@@ -78,8 +220,13 @@ def describe_instances(cache, session):
                         "running",
                         "stopped" 
                     ]
+                },
+                {
+                    "Name": "ip-address",
+                    "Values": ["*"]
                 }
-            ]
+            ],
+            PaginationConfig={"PageSize": 1000}
         ):
         for r in page["Reservations"]:
             for i in r["Instances"]:
@@ -94,20 +241,20 @@ def describe_instances(cache, session):
                     continue
                 except KeyError:
                     pass
+                # If the Public IP is missing or empty the instance is not public and cannot be scanned
+                if not i.get("PublicIpAddress"):
+                    continue
                 # Use a list comprehension to attempt to get SSM info for the instance
                 managedInstanceInfo = [mnginst for mnginst in managedInstances if mnginst["InstanceId"] == i["InstanceId"]]
                 i["ManagedInstanceInformation"] = managedInstanceInfo
-                instanceList.append(i)
-
-        cache["describe_instances"] = instanceList
-        return cache["describe_instances"]
+                yield i
     
 def describe_elastic_ips(cache, session):
     response = cache.get("describe_elastic_ips")
     if response:
         return response
     
-    ec2 = session.client("ec2")
+    ec2 = get_client(cache, session, "ec2")
 
     cache["describe_elastic_ips"] = ec2.describe_addresses()["Addresses"]
     return cache["describe_elastic_ips"]
@@ -117,9 +264,13 @@ def describe_load_balancers(cache, session):
     if response:
         return response
     
-    elbv2 = session.client("elbv2")
+    elbv2 = get_client(cache, session, "elbv2")
+
+    loadBalancers = []
+    for page in elbv2.get_paginator("describe_load_balancers").paginate(PaginationConfig={"PageSize": 400}):
+        loadBalancers.extend(page["LoadBalancers"])
 
-    cache["describe_load_balancers"] = elbv2.describe_load_balancers()["LoadBalancers"]
+    cache["describe_load_balancers"] = loadBalancers
     return cache["describe_load_balancers"]
 
 def describe_clbs(cache, session):
@@ -127,18 +278,17 @@ def describe_clbs(cache, session):
     if response:
         return response
     
-    elb = session.client("elb")
+    elb = get_client(cache, session, "elb")
 
     cache["describe_load_balancers"] = elb.describe_load_balancers()["LoadBalancerDescriptions"]
     return cache["describe_load_balancers"]
 
 def cloudfront_paginate(cache, session):
-    cloudfront = session.client("cloudfront")
-
     itemList = []
     response = cache.get("items")
     if response:
         return response
+    cloudfront = get_client(cache, session, "cloudfront")
     paginator = cloudfront.get_paginator("list_distributions")
     if paginator:
         for page in paginator.paginate():
@@ -151,12 +301,11 @@ def cloudfront_paginate(cache, session):
         return cache["items"]
 
 def get_public_hosted_zones(cache, session):
-    route53 = session.client("route53")
-
     zones = []
     response = cache.get("get_hosted_zones")
     if response:
         return response
+    route53 = get_client(cache, session, "route53")
     paginator = route53.get_paginator('list_hosted_zones')
     if paginator:
         for page in paginator.paginate():
@@ -168,28 +317,216 @@ def get_public_hosted_zones(cache, session):
         cache["get_hosted_zones"] = zones
         return cache["get_hosted_zones"]
 
+def get_nmap_scanner():
+    # Instantiate a NMAP scanner for TCP scans to define ports
+    global nmap
+    if nmap is None:
+        nmap = nmap3.NmapScanTechniques()
+    return nmap
+
+def resolve_host(hostName):
+    # Returns the first IPv4 address of a DNS name, which is the address NMAP scans for a name, or None if it does not resolve
+    try:
+        return socket.getaddrinfo(hostName, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    except (socket.gaierror, IndexError):
+        return None
+
+def get_scan_results(cache):
+    # Scan results are kept in the Auditor cache keyed by host and port list, so a host which more than one check
+    # covers (such as an EC2 instance and its Elastic IP) is only scanned once per Account & Region
+    scanResults = cache.get("nmap_scan_results")
+    if scanResults is None:
+        scanResults = cache["nmap_scan_results"] = {}
+    return scanResults
+
 # This function performs the actual NMAP Scan
-def scan_host(host_ip, host_name, asset_type):
+def scan_host(cache, host_ip, host_name, asset_type):
+    scanResults = get_scan_results(cache)
+    scanKey = (host_ip, NMAP_TCP_PORTS)
+    if scanKey in scanResults:
+        return scanResults[scanKey]
     try:
-        results = nmap.nmap_tcp_scan(
+        results = get_nmap_scanner().nmap_tcp_scan(
             host_ip,
-            # FTP, SSH, TelNet, SMTP, HTTP, POP3, NetBIOS, SMB, RDP, MSSQL, MySQL/MariaDB, NFS, Docker, Oracle, PostgreSQL, 
-            # Kibana, VMWare, Proxy, Splunk, K8s, Redis, Kafka, Mongo, Rabbit/AmazonMQ, SparkUI
-            args="-Pn -p 21,22,23,25,80,110,139,445,3389,1433,3306,2049,2375,1521,5432,5601,8182,8080,8089,10250,6379,9092,27017,5672,4040"
+            args=f"-Pn -p {NMAP_TCP_PORTS}"
         )
 
         print(f"Scanning {asset_type} {host_name} on {host_ip}")
-        return results
     except KeyError:
         results = None
 
-@registry.register_check("ec2")
-def ec2_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
-    """[AttackSurface.EC2.{checkIdNumber}] EC2 Instances should not be publicly reachable on {serviceName}"""
+    scanResults[scanKey] = results
+    return results
+
+def scan_hosts_batch(hosts):
+    # Scans every IP with a single NMAP TCP connect scan, the targets are passed over stdin with -iL and reverse DNS
+    # is skipped (-n) as findings never use it. Results are keyed by IP in the same shape nmap3 returns. The XML is
+    # parsed as NMAP streams it and each host is cleared once read, so the full report is never held in memory.
+    # stderr goes to a temporary file so it cannot fill a pipe and stall NMAP
+    results = {}
+    with tempfile.TemporaryFile() as nmapErrors:
+        process = subprocess.Popen(
+            ["nmap", "-oX", "-", "-sT", "-Pn", "-n", "-T4", "-p", NMAP_TCP_PORTS, "-iL", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=nmapErrors
+        )
+        process.stdin.write("\n".join(hosts).encode("utf-8"))
+        process.stdin.close()
+        try:
+            for event, host in ET.iterparse(process.stdout, events=("end",)):
+                if host.tag != "host":
+                    continue
+                hostIp = host.find("address").get("addr")
+                ports = []
+                for port in host.iter("port"):
+                    portDetails = dict(port.attrib)
+                    portDetails.update(port.find("state").attrib)
+                    service = port.find("service")
+                    if service is not None:
+                        portDetails["service"] = dict(service.attrib)
+                    ports.append(portDetails)
+                results[hostIp] = {hostIp: {"ports": ports}}
+                host.clear()
+        except ET.ParseError:
+            nmapErrors.seek(0)
+            print(f"NMAP failed to scan {len(hosts)} hosts: {nmapErrors.read().decode('utf-8', 'replace').strip()}")
+        finally:
+            process.stdout.close()
+            process.wait()
+
+    return results
+
+def submit_scan_batch(executor, batch):
+    # Starts the NMAP scan of a batch of (host, name, asset type, asset) targets
+    for hostIp, hostName, assetType, asset in batch:
+        print(f"Scanning {assetType} {hostName} on {hostIp}")
+    return executor.submit(scan_hosts_batch, list(dict.fromkeys(target[0] for target in batch)))
+
+def scan_hosts(cache, targets):
+    # Split an iterable of (host, name, asset type, asset) targets into batches, scan the batches concurrently and
+    # yield each (host, asset, scan results) as soon as its batch completes. Hosts NMAP could not scan get None.
+    # Each batch is submitted as soon as it fills so scanning overlaps with listing the targets
+    scanResults = get_scan_results(cache)
+    with ThreadPoolExecutor(max_workers=NMAP_MAX_WORKERS) as executor:
+        futures = {}
+        batch = []
+        for target in targets:
+            # Hosts already scanned by an earlier check are not scanned again
+            scanKey = (target[0], NMAP_TCP_PORTS)
+            if scanKey in scanResults:
+                yield target[0], target[3], scanResults[scanKey]
+                continue
+            batch.append(target)
+            if len(batch) == NMAP_BATCH_SIZE:
+                futures[submit_scan_batch(executor, batch)] = batch
+                batch = []
+        if batch:
+            futures[submit_scan_batch(executor, batch)] = batch
+        for future in as_completed(futures):
+            results = future.result()
+            for hostIp, hostName, assetType, asset in futures[future]:
+                scanResults[(hostIp, NMAP_TCP_PORTS)] = results.get(hostIp)
+                yield hostIp, asset, results.get(hostIp)
+
+def ec2_instance_resources(instanceArn, awsPartition, awsRegion, instanceType, instanceImage, vpcId, subnetId, launchedAt):
+    # Resources block for EC2 attack surface findings
+    return [
+        {
+            "Type": "AwsEc2Instance",
+            "Id": instanceArn,
+            "Partition": awsPartition,
+            "Region": awsRegion,
+            "Details": {
+                "AwsEc2Instance": {
+                    "Type": instanceType,
+                    "ImageId": instanceImage,
+                    "VpcId": vpcId,
+                    "SubnetId": subnetId,
+                    "LaunchedAt": launchedAt
+                }
+            }
+        }
+    ]
+
+def open_tcp_port_findings(cache, targets, findingDetails, awsAccountId, awsRegion, awsPartition):
+    # Scans the (IP, name, asset type, (arn, name, b64 details, resources)) targets and yields a finding for every
+    # port NMAP reports on, used by the EC2 and ALB checks with their respective findingDetails
     # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
-    # Paginate the iterator object from Cache
-    for i in describe_instances(cache, session):
+    iso8601Time = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    # Fields which are the same for every finding in this run are folded into the templates once
+    runFields = {
+        "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
+        "AwsAccountId": awsAccountId,
+        "FirstObservedAt": iso8601Time,
+        "CreatedAt": iso8601Time,
+        "UpdatedAt": iso8601Time
+    }
+    failedTemplate = {**findingDetails["FailedTemplate"], **runFields}
+    passedTemplate = {**findingDetails["PassedTemplate"], **runFields}
+    # NMAP returns the port number, state and reason as strings
+    getPortStateReason = itemgetter("portid", "state", "reason")
+    for hostIp, (assetArn, assetName, assetB64, assetResources), scanner in scan_hosts(cache, targets):
+        # NoneType returned on KeyError due to Nmap errors
+        if scanner == None:
+            continue
+        # Loop the results of the scan - starting with Open Ports which require a combination of
+        # a Public Instance, an open SG rule, and a running service/server on the host itself
+        # use enumerate and a fixed offset to product the Check Title ID number
+        try:
+            for index, p in enumerate(scanner[hostIp]["ports"], start=1):
+                # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
+                checkIdNumber = str(index)
+                portId, serviceState, serviceStateReason = getPortStateReason(p)
+                portNumber = int(portId)
+                serviceName = PORT_SERVICE_OVERRIDES.get(portNumber)
+                if serviceName is None:
+                    try:
+                        serviceName = str(p["service"]["name"]).upper()
+                    except KeyError:
+                        serviceName = "Unknown"
+                # This is a failing check
+                if serviceState == "open":
+                    template = failedTemplate
+                    description = findingDetails["FailedDescription"]
+                    complianceStatus = "FAILED"
+                elif EMIT_PASS_FINDINGS:
+                    template = passedTemplate
+                    description = findingDetails["PassedDescription"]
+                    complianceStatus = "PASSED"
+                else:
+                    continue
+                finding = {
+                    **template,
+                    "Id": f"{assetArn}/" + findingDetails["Id"].format(serviceName=serviceName),
+                    "GeneratorId": assetArn,
+                    "Title": findingDetails["Title"].format(checkIdNumber=checkIdNumber, serviceName=serviceName),
+                    "Description": description.format(
+                        assetName=assetName,
+                        portNumber=portNumber,
+                        serviceName=serviceName,
+                        serviceStateReason=serviceStateReason
+                    ),
+                    "ProductFields": {
+                        **findingDetails["ProductFields"],
+                        "ProviderAccountId": awsAccountId,
+                        "AssetRegion": awsRegion,
+                        "AssetDetails": assetB64
+                    },
+                    "Resources": assetResources,
+                    "Compliance": {
+                        "Status": complianceStatus,
+                        "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
+                    }
+                }
+                yield finding
+        except KeyError:
+            continue
+
+def ec2_scan_targets(cache, session, awsAccountId, awsRegion, awsPartition):
+    # Yields the scan target for each public instance as the instances are listed
+    for i in iter_public_instances(cache, session):
+        hostIp = i["PublicIpAddress"]
         # B64 encode all of the details for the Asset
         assetJson = json.dumps(i,default=str).encode("utf-8")
         assetB64 = base64.b64encode(assetJson)
@@ -199,215 +536,46 @@ def ec2_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
         instanceImage = str(i["ImageId"])
         subnetId = str(i["SubnetId"])
         vpcId = str(i["VpcId"])
-        try:
-            instanceLaunchedAt = str(i["BlockDeviceMappings"][0]["Ebs"]["AttachTime"])
-        except KeyError:
-            instanceLaunchedAt = str(i["LaunchTime"])
-        # If Public DNS or Public IP are empty it means the instance is not public, we can skip this
-        try:
-            hostIp = i["PublicIpAddress"]
-            if hostIp == ("" or None):
-                continue
-        except KeyError:
-            continue
+        blockDeviceMappings = i.get("BlockDeviceMappings")
+        if blockDeviceMappings and "Ebs" in blockDeviceMappings[0]:
+            instanceLaunchedAt = blockDeviceMappings[0]["Ebs"]["AttachTime"]
         else:
-            scanner = scan_host(hostIp, instanceId, "EC2 Instance")
-            # NoneType returned on KeyError due to Nmap errors
-            if scanner == None:
-                continue
-            else:
-                # Loop the results of the scan - starting with Open Ports which require a combination of
-                # a Public Instance, an open SG rule, and a running service/server on the host itself
-                # use enumerate and a fixed offset to product the Check Title ID number
-                try:
-                    for index, p in enumerate(scanner[hostIp]["ports"]):
-                        # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
-                        checkIdNumber = str(int(index + 1))
-                        portNumber = int(p["portid"])
-                        if portNumber == 8089:
-                            serviceName = 'SPLUNKD'
-                        elif portNumber == 10250:
-                            serviceName = 'KUBERNETES-API'
-                        elif portNumber == 5672:
-                            serviceName = 'RABBITMQ'
-                        elif portNumber == 4040:
-                            serviceName = 'SPARK-WEBUI'
-                        else:
-                            try:
-                                serviceName = str(p["service"]["name"]).upper()
-                            except KeyError:
-                                serviceName = "Unknown"
-                        serviceStateReason = str(p["reason"])
-                        serviceState = str(p["state"])
-                        # This is a failing check
-                        if serviceState == "open":
-                            finding = {
-                                "SchemaVersion": "2018-10-08",
-                                "Id": f"{instanceArn}/attack-surface-ec2-open-{serviceName}-check",
-                                "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
-                                "GeneratorId": instanceArn,
-                                "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
-                                "FirstObservedAt": iso8601Time,
-                                "CreatedAt": iso8601Time,
-                                "UpdatedAt": iso8601Time,
-                                "Severity": {"Label": "HIGH"},
-                                "Confidence": 99,
-                                "Title": f"[AttackSurface.EC2.{checkIdNumber}] EC2 Instances should not be publicly reachable on {serviceName}",
-                                "Description": f"EC2 instance {instanceId} is publicly reachable on port {portNumber} which corresponds to the {serviceName} service. When Services are successfully fingerprinted by the ElectricEye Attack Surface Management Auditor it means the instance is Public, has an open Secuirty Group rule, and a running service on the host which adversaries can also see. Refer to the remediation insturctions for an example of a way to secure EC2 instances.",
-                                "Remediation": {
-                                    "Recommendation": {
-                                        "Text": "EC2 Instances should only have the minimum necessary ports open to achieve their purposes, allow traffic from authorized sources, and use other defense-in-depth and hardening strategies. For a basic view on traffic authorization into your instances refer to the Authorize inbound traffic for your Linux instances section of the Amazon Elastic Compute Cloud User Guide",
-                                        "Url": "https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/authorizing-access-to-an-instance.html"
-                                    }
-                                },
-                                "ProductFields": {
-                                    "ProductName": "ElectricEye",
-                                    "Provider": "AWS",
-                                    "ProviderType": "CSP",
-                                    "ProviderAccountId": awsAccountId,
-                                    "AssetRegion": awsRegion,
-                                    "AssetDetails": assetB64,
-                                    "AssetClass": "Compute",
-                                    "AssetService": "Amazon EC2",
-                                    "AssetComponent": "Instance"
-                                },
-                                "Resources": [
-                                    {
-                                        "Type": "AwsEc2Instance",
-                                        "Id": instanceArn,
-                                        "Partition": awsPartition,
-                                        "Region": awsRegion,
-                                        "Details": {
-                                            "AwsEc2Instance": {
-                                                "Type": instanceType,
-                                                "ImageId": instanceImage,
-                                                "VpcId": vpcId,
-                                                "SubnetId": subnetId,
-                                                "LaunchedAt": parse(instanceLaunchedAt).isoformat()
-                                            }
-                                        },
-                                    }
-                                ],
-                                "Compliance": {
-                                    "Status": "FAILED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
-                                },
-                                "Workflow": {"Status": "NEW"},
-                                "RecordState": "ACTIVE"
-                            }
-                            yield finding
-                        else:
-                            finding = {
-                                "SchemaVersion": "2018-10-08",
-                                "Id": f"{instanceArn}/attack-surface-ec2-open-{serviceName}-check",
-                                "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
-                                "GeneratorId": instanceArn,
-                                "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
-                                "FirstObservedAt": iso8601Time,
-                                "CreatedAt": iso8601Time,
-                                "UpdatedAt": iso8601Time,
-                                "Severity": {"Label": "INFORMATIONAL"},
-                                "Confidence": 99,
-                                "Title": f"[AttackSurface.EC2.{checkIdNumber}] EC2 Instances should not be publicly reachable on {serviceName}",
-                                "Description": f"EC2 instance {instanceId} is not publicly reachable on port {portNumber} which corresponds to the {serviceName} service due to {serviceStateReason}. Instances and their respective Security Groups should still be reviewed for minimum necessary access.",
-                                "Remediation": {
-                                    "Recommendation": {
-                                        "Text": "EC2 Instances should only have the minimum necessary ports open to achieve their purposes, allow traffic from authorized sources, and use other defense-in-depth and hardening strategies. For a basic view on traffic authorization into your instances refer to the Authorize inbound traffic for your Linux instances section of the Amazon Elastic Compute Cloud User Guide",
-                                        "Url": "https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/authorizing-access-to-an-instance.html"
-                                    }
-                                },
-                                "ProductFields": {
-                                    "ProductName": "ElectricEye",
-                                    "Provider": "AWS",
-                                    "ProviderType": "CSP",
-                                    "ProviderAccountId": awsAccountId,
-                                    "AssetRegion": awsRegion,
-                                    "AssetDetails": assetB64,
-                                    "AssetClass": "Compute",
-                                    "AssetService": "Amazon EC2",
-                                    "AssetComponent": "Instance"
-                                },
-                                "Resources": [
-                                    {
-                                        "Type": "AwsEc2Instance",
-                                        "Id": instanceArn,
-                                        "Partition": awsPartition,
-                                        "Region": awsRegion,
-                                        "Details": {
-                                            "AwsEc2Instance": {
-                                                "Type": instanceType,
-                                                "ImageId": instanceImage,
-                                                "VpcId": vpcId,
-                                                "SubnetId": subnetId,
-                                                "LaunchedAt": parse(instanceLaunchedAt).isoformat()
-                                            }
-                                        },
-                                    }
-                                ],
-                                "Compliance": {
-                                    "Status": "PASSED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
-                                },
-                                "Workflow": {"Status": "RESOLVED"},
-                                "RecordState": "ARCHIVED"
-                            }
-                            yield finding
-                except KeyError:
-                    continue
+            instanceLaunchedAt = i["LaunchTime"]
+        # boto3 already returns datetimes, any string is ISO 8601
+        if isinstance(instanceLaunchedAt, datetime.datetime):
+            launchedAt = instanceLaunchedAt.isoformat()
+        else:
+            launchedAt = datetime.datetime.fromisoformat(instanceLaunchedAt).isoformat()
+        # Resources are the same for every port, so the launch time is only formatted once per instance
+        instanceResources = ec2_instance_resources(instanceArn, awsPartition, awsRegion, instanceType, instanceImage, vpcId, subnetId, launchedAt)
+        yield hostIp, instanceId, "EC2 Instance", (instanceArn, instanceId, assetB64, instanceResources)
+
+@registry.register_check("ec2")
+def ec2_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
+    """[AttackSurface.EC2.{checkIdNumber}] EC2 Instances should not be publicly reachable on {serviceName}"""
+    yield from open_tcp_port_findings(
+        cache,
+        ec2_scan_targets(cache, session, awsAccountId, awsRegion, awsPartition),
+        EC2_ATTACK_SURFACE_FINDING,
+        awsAccountId,
+        awsRegion,
+        awsPartition
+    )
 
 @registry.register_check("elasticloadbalancingv2")
 def elbv2_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
     """[AttackSurface.ELBv2.{checkIdNumber}] Application Load Balancers should not be publicly reachable on {serviceName}"""
-    # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
-    # Loop ELBs and select the public ALBs
-    for lb in describe_load_balancers(cache, session):
+    # Only public ALBs are scanned
+    publicAlbs = [
+        lb for lb in describe_load_balancers(cache, session) if lb["Scheme"] == "internet-facing" and lb["Type"] == "application"
+    ]
+    # Resolve the ALB DNS names concurrently up front so NMAP is handed IPs, ALBs which do not resolve cannot be scanned
+    with ThreadPoolExecutor(max_workers=NMAP_MAX_WORKERS) as executor:
+        albIps = list(executor.map(resolve_host, [lb["DNSName"] for lb in publicAlbs]))
+    targets = []
+    for lb, hostIp in zip(publicAlbs, albIps):
+        if hostIp is None:
+            continue
         # B64 encode all of the details for the Asset
         assetJson = json.dumps(lb,default=str).encode("utf-8")
         assetB64 = base64.b64encode(assetJson)
@@ -418,207 +586,32 @@ def elbv2_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId:
         elbv2Scheme = str(lb["Scheme"])
         elbv2VpcId = str(lb["VpcId"])
         elbv2IpAddressType = str(lb["IpAddressType"])
-        if (elbv2Scheme == 'internet-facing' and elbv2LbType == 'application'):
-            scanner = scan_host(elbv2DnsName, elbv2Name, "Application load balancer")
-            # NoneType returned on KeyError due to Nmap errors
-            if scanner == None:
-                continue
-            else:
-                # Pull out the IP resolution of the DNS Name
-                keys = scanner.keys()
-                hostIp = (list(keys)[0])
-                # Loop the results of the scan - starting with Open Ports which require a combination of
-                # a Public Instance, an open SG rule, and a running service/server on the host itself
-                # use enumerate and a fixed offset to product the Check Title ID number
-                try:
-                    for index, p in enumerate(scanner[hostIp]["ports"]):
-                        # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
-                        checkIdNumber = str(int(index + 1))
-                        portNumber = int(p["portid"])
-                        if portNumber == 8089:
-                            serviceName = 'SPLUNKD'
-                        elif portNumber == 10250:
-                            serviceName = 'KUBERNETES-API'
-                        elif portNumber == 5672:
-                            serviceName = 'RABBITMQ'
-                        elif portNumber == 4040:
-                            serviceName = 'SPARK-WEBUI'
-                        else:
-                            try:
-                                serviceName = str(p["service"]["name"]).upper()
-                            except KeyError:
-                                serviceName = "Unknown"
-                        serviceStateReason = str(p["reason"])
-                        serviceState = str(p["state"])
-                        # This is a failing check
-                        if serviceState == "open":
-                            finding = {
-                                "SchemaVersion": "2018-10-08",
-                                "Id": f"{elbv2Arn}/attack-surface-elbv2-open-{serviceName}-check",
-                                "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
-                                "GeneratorId": elbv2Arn,
-                                "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
-                                "FirstObservedAt": iso8601Time,
-                                "CreatedAt": iso8601Time,
-                                "UpdatedAt": iso8601Time,
-                                "Severity": {"Label": "HIGH"},
-                                "Confidence": 99,
-                                "Title": f"[AttackSurface.ELBv2.{checkIdNumber}] Application Load Balancers should not be publicly reachable on {serviceName}",
-                                "Description": f"Application load balancer {elbv2Name} is publicly reachable on port {portNumber} which corresponds to the {serviceName} service. When Services are successfully fingerprinted by the ElectricEye Attack Surface Management Auditor it means the instance is Public, has an open Secuirty Group rule, and a running service on the host which adversaries can also see. Refer to the remediation insturctions for an example of a way to secure EC2 instances.",
-                                "Remediation": {
-                                    "Recommendation": {
-                                        "Text": "For more information on ALB security group reccomendations refer to the Security groups for your Application Load Balancer section of the Application Load Balancers User Guide.",
-                                        "Url": "https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-update-security-groups.html#security-group-recommended-rules"
-                                    }
-                                },
-                                "ProductFields": {
-                                    "ProductName": "ElectricEye",
-                                    "Provider": "AWS",
-                                    "ProviderType": "CSP",
-                                    "ProviderAccountId": awsAccountId,
-                                    "AssetRegion": awsRegion,
-                                    "AssetDetails": assetB64,
-                                    "AssetClass": "Networking",
-                                    "AssetService": "AWS Elastic Load Balancer V2",
-                                    "AssetComponent": "Application Load Balancer"
-                                },
-                                "Resources": [
-                                    {
-                                        "Type": "AwsElbv2LoadBalancer",
-                                        "Id": elbv2Arn,
-                                        "Partition": awsPartition,
-                                        "Region": awsRegion,
-                                        "Details": {
-                                            "AwsElbv2LoadBalancer": {
-                                                "DNSName": elbv2DnsName,
-                                                "IpAddressType": elbv2IpAddressType,
-                                                "Scheme": elbv2Scheme,
-                                                "Type": elbv2LbType,
-                                                "VpcId": elbv2VpcId
-                                            }
-                                        }
-                                    }
-                                ],
-                                "Compliance": {
-                                    "Status": "FAILED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
-                                },
-                                "Workflow": {"Status": "NEW"},
-                                "RecordState": "ACTIVE"
-                            }
-                            yield finding
-                        else:
-                            finding = {
-                                "SchemaVersion": "2018-10-08",
-                                "Id": f"{elbv2Arn}/attack-surface-elbv2-open-{serviceName}-check",
-                                "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
-                                "GeneratorId": elbv2Arn,
-                                "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
-                                "FirstObservedAt": iso8601Time,
-                                "CreatedAt": iso8601Time,
-                                "UpdatedAt": iso8601Time,
-                                "Severity": {"Label": "INFORMATIONAL"},
-                                "Confidence": 99,
-                                "Title": f"[AttackSurface.ELBv2.{checkIdNumber}] Application Load Balancers should not be publicly reachable on {serviceName}",
-                                "Description": f"Application load balancer {elbv2Name} is not publicly reachable on port {portNumber} which corresponds to the {serviceName} service due to {serviceStateReason}. ALBs and their respective Security Groups should still be reviewed for minimum necessary access.",
-                                "Remediation": {
-                                    "Recommendation": {
-                                        "Text": "For more information on ALB security group reccomendations refer to the Security groups for your Application Load Balancer section of the Application Load Balancers User Guide.",
-                                        "Url": "https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-update-security-groups.html#security-group-recommended-rules"
-                                    }
-                                },
-                                "ProductFields": {
-                                    "ProductName": "ElectricEye",
-                                    "Provider": "AWS",
-                                    "ProviderType": "CSP",
-                                    "ProviderAccountId": awsAccountId,
-                                    "AssetRegion": awsRegion,
-                                    "AssetDetails": assetB64,
-                                    "AssetClass": "Networking",
-                                    "AssetService": "AWS Elastic Load Balancer V2",
-                                    "AssetComponent": "Application Load Balancer"
-                                },
-                                "Resources": [
-                                    {
-                                        "Type": "AwsElbv2LoadBalancer",
-                                        "Id": elbv2Arn,
-                                        "Partition": awsPartition,
-                                        "Region": awsRegion,
-                                        "Details": {
-                                            "AwsElbv2LoadBalancer": {
-                                                "DNSName": elbv2DnsName,
-                                                "IpAddressType": elbv2IpAddressType,
-                                                "Scheme": elbv2Scheme,
-                                                "Type": elbv2LbType,
-                                                "VpcId": elbv2VpcId
-                                            }
-                                        }
-                                    }
-                                ],
-                                "Compliance": {
-                                    "Status": "PASSED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
-                                },
-                                "Workflow": {"Status": "RESOLVED"},
-                                "RecordState": "ARCHIVED"
-                            }
-                            yield finding
-                except KeyError:
-                    continue
-        else:
-            continue
+        albResources = [
+            {
+                "Type": "AwsElbv2LoadBalancer",
+                "Id": elbv2Arn,
+                "Partition": awsPartition,
+                "Region": awsRegion,
+                "Details": {
+                    "AwsElbv2LoadBalancer": {
+                        "DNSName": elbv2DnsName,
+                        "IpAddressType": elbv2IpAddressType,
+                        "Scheme": elbv2Scheme,
+                        "Type": elbv2LbType,
+                        "VpcId": elbv2VpcId
+                    }
+                }
+            }
+        ]
+        targets.append((hostIp, elbv2Name, "Application load balancer", (elbv2Arn, elbv2Name, assetB64, albResources)))
+
+    yield from open_tcp_port_findings(cache, targets, ELBV2_ATTACK_SURFACE_FINDING, awsAccountId, awsRegion, awsPartition)
 
 @registry.register_check("elasticloadbalancing")
 def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
     """[AttackSurface.ELB.{checkIdNumber}] Classic Load Balancers should not be publicly reachable on {serviceName}"""
     # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
+    iso8601Time = datetime.datetime.now(datetime.timezone.utc).isoformat()
     for lb in describe_clbs(cache, session):
         # B64 encode all of the details for the Asset
         assetJson = json.dumps(lb,default=str).encode("utf-8")
@@ -632,7 +625,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
         lbVpc = lb["VPCId"]
         clbScheme = str(lb["Scheme"])
         if clbScheme == 'internet-facing':
-            scanner = scan_host(dnsName, clbName)
+            scanner = scan_host(cache, dnsName, clbName, "Classic load balancer")
             # NoneType returned on KeyError due to Nmap errors
             if scanner == None:
                 continue
@@ -648,15 +641,8 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                         # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
                         checkIdNumber = str(int(index + 1))
                         portNumber = int(p["portid"])
-                        if portNumber == 8089:
-                            serviceName = 'SPLUNKD'
-                        elif portNumber == 10250:
-                            serviceName = 'KUBERNETES-API'
-                        elif portNumber == 5672:
-                            serviceName = 'RABBITMQ'
-                        elif portNumber == 4040:
-                            serviceName = 'SPARK-WEBUI'
-                        else:
+                        serviceName = PORT_SERVICE_OVERRIDES.get(portNumber)
+                        if serviceName is None:
                             try:
                                 serviceName = str(p["service"]["name"]).upper()
                             except KeyError:
@@ -671,10 +657,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                                 "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                                 "GeneratorId": clbArn,
                                 "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
+                                "Types": ATTACK_SURFACE_FINDING_TYPES,
                                 "FirstObservedAt": iso8601Time,
                                 "CreatedAt": iso8601Time,
                                 "UpdatedAt": iso8601Time,
@@ -720,26 +703,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                                 ],
                                 "Compliance": {
                                     "Status": "FAILED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
+                                    "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                                 },
                                 "Workflow": {"Status": "NEW"},
                                 "RecordState": "ACTIVE"
@@ -752,10 +716,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                                 "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                                 "GeneratorId": clbArn,
                                 "AwsAccountId": awsAccountId,
-                                "Types": [
-                                    "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                    "TTPs/Discovery"
-                                ],
+                                "Types": ATTACK_SURFACE_FINDING_TYPES,
                                 "FirstObservedAt": iso8601Time,
                                 "CreatedAt": iso8601Time,
                                 "UpdatedAt": iso8601Time,
@@ -801,26 +762,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                                 ],
                                 "Compliance": {
                                     "Status": "PASSED",
-                                    "RelatedRequirements": [
-                                        "NIST CSF V1.1 PR.AC-3",
-                                        "NIST SP 800-53 Rev. 4 AC-1",
-                                        "NIST SP 800-53 Rev. 4 AC-17",
-                                        "NIST SP 800-53 Rev. 4 AC-19",
-                                        "NIST SP 800-53 Rev. 4 AC-20",
-                                        "NIST SP 800-53 Rev. 4 SC-15",
-                                        "AICPA TSC CC6.6",
-                                        "ISO 27001:2013 A.6.2.1",
-                                        "ISO 27001:2013 A.6.2.2",
-                                        "ISO 27001:2013 A.11.2.6",
-                                        "ISO 27001:2013 A.13.1.1",
-                                        "ISO 27001:2013 A.13.2.1",
-                                        "MITRE ATT&CK T1040",
-                                        "MITRE ATT&CK T1046",
-                                        "MITRE ATT&CK T1580",
-                                        "MITRE ATT&CK T1590",
-                                        "MITRE ATT&CK T1592",
-                                        "MITRE ATT&CK T1595"
-                                    ]
+                                    "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                                 },
                                 "Workflow": {"Status": "RESOLVED"},
                                 "RecordState": "ARCHIVED"
@@ -835,7 +777,7 @@ def elb_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
 def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
     """[AttackSurface.EIP.{checkIdNumber}] Elastic IPs should not advertise publicly reachable {serviceName} services"""
     # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
+    iso8601Time = datetime.datetime.now(datetime.timezone.utc).isoformat()
     # Gather all EIPs
     for eip in describe_elastic_ips(cache, session):
         # B64 encode all of the details for the Asset
@@ -845,7 +787,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
         publicIp = eip["PublicIp"]
         eipArn = f"arn:{awsPartition}:ec2:{awsRegion}:{awsAccountId}:elastic-ip/{allocationId}" 
         # Logic time
-        scanner = scan_host(publicIp, allocationId, "Elastic IP")
+        scanner = scan_host(cache, publicIp, allocationId, "Elastic IP")
         # NoneType returned on KeyError due to Nmap errors
         if scanner == None:
             continue
@@ -858,15 +800,8 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                     # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
                     checkIdNumber = str(int(index + 1))
                     portNumber = int(p["portid"])
-                    if portNumber == 8089:
-                        serviceName = 'SPLUNKD'
-                    elif portNumber == 10250:
-                        serviceName = 'KUBERNETES-API'
-                    elif portNumber == 5672:
-                        serviceName = 'RABBITMQ'
-                    elif portNumber == 4040:
-                        serviceName = 'SPARK-WEBUI'
-                    else:
+                    serviceName = PORT_SERVICE_OVERRIDES.get(portNumber)
+                    if serviceName is None:
                         try:
                             serviceName = str(p["service"]["name"]).upper()
                         except KeyError:
@@ -881,10 +816,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                             "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                             "GeneratorId": eipArn,
                             "AwsAccountId": awsAccountId,
-                            "Types": [
-                                "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                "TTPs/Discovery"
-                            ],
+                            "Types": ATTACK_SURFACE_FINDING_TYPES,
                             "FirstObservedAt": iso8601Time,
                             "CreatedAt": iso8601Time,
                             "UpdatedAt": iso8601Time,
@@ -925,26 +857,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                             ],
                             "Compliance": {
                                 "Status": "FAILED",
-                                "RelatedRequirements": [
-                                    "NIST CSF V1.1 PR.AC-3",
-                                    "NIST SP 800-53 Rev. 4 AC-1",
-                                    "NIST SP 800-53 Rev. 4 AC-17",
-                                    "NIST SP 800-53 Rev. 4 AC-19",
-                                    "NIST SP 800-53 Rev. 4 AC-20",
-                                    "NIST SP 800-53 Rev. 4 SC-15",
-                                    "AICPA TSC CC6.6",
-                                    "ISO 27001:2013 A.6.2.1",
-                                    "ISO 27001:2013 A.6.2.2",
-                                    "ISO 27001:2013 A.11.2.6",
-                                    "ISO 27001:2013 A.13.1.1",
-                                    "ISO 27001:2013 A.13.2.1",
-                                    "MITRE ATT&CK T1040",
-                                    "MITRE ATT&CK T1046",
-                                    "MITRE ATT&CK T1580",
-                                    "MITRE ATT&CK T1590",
-                                    "MITRE ATT&CK T1592",
-                                    "MITRE ATT&CK T1595"
-                                ]
+                                "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                             },
                             "Workflow": {"Status": "NEW"},
                             "RecordState": "ACTIVE"
@@ -957,10 +870,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                             "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                             "GeneratorId": eipArn,
                             "AwsAccountId": awsAccountId,
-                            "Types": [
-                                "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                "TTPs/Discovery"
-                            ],
+                            "Types": ATTACK_SURFACE_FINDING_TYPES,
                             "FirstObservedAt": iso8601Time,
                             "CreatedAt": iso8601Time,
                             "UpdatedAt": iso8601Time,
@@ -1001,26 +911,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
                             ],
                             "Compliance": {
                                 "Status": "PASSED",
-                                "RelatedRequirements": [
-                                    "NIST CSF V1.1 PR.AC-3",
-                                    "NIST SP 800-53 Rev. 4 AC-1",
-                                    "NIST SP 800-53 Rev. 4 AC-17",
-                                    "NIST SP 800-53 Rev. 4 AC-19",
-                                    "NIST SP 800-53 Rev. 4 AC-20",
-                                    "NIST SP 800-53 Rev. 4 SC-15",
-                                    "AICPA TSC CC6.6",
-                                    "ISO 27001:2013 A.6.2.1",
-                                    "ISO 27001:2013 A.6.2.2",
-                                    "ISO 27001:2013 A.11.2.6",
-                                    "ISO 27001:2013 A.13.1.1",
-                                    "ISO 27001:2013 A.13.2.1",
-                                    "MITRE ATT&CK T1040",
-                                    "MITRE ATT&CK T1046",
-                                    "MITRE ATT&CK T1580",
-                                    "MITRE ATT&CK T1590",
-                                    "MITRE ATT&CK T1592",
-                                    "MITRE ATT&CK T1595"
-                                ]
+                                "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                             },
                             "Workflow": {"Status": "RESOLVED"},
                             "RecordState": "ARCHIVED"
@@ -1033,7 +924,7 @@ def eip_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: s
 def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
     """[AttackSurface.Cloudfront.{checkIdNumber}] Cloudfront Distributions should not be publicly reachable on {serviceName}"""
     # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
+    iso8601Time = datetime.datetime.now(datetime.timezone.utc).isoformat()
     for dist in cloudfront_paginate(cache, session):
         # B64 encode all of the details for the Asset
         assetJson = json.dumps(dist,default=str).encode("utf-8")
@@ -1043,7 +934,7 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
         domainName = dist["DomainName"]
         distStatus = dist["Status"]
         # Logic time
-        scanner = scan_host(domainName, distributionId, "CloudFront Distribution")
+        scanner = scan_host(cache, domainName, distributionId, "CloudFront Distribution")
         # NoneType returned on KeyError due to Nmap errors
         if scanner == None:
             continue
@@ -1059,15 +950,8 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
                     # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
                     checkIdNumber = str(int(index + 1))
                     portNumber = int(p["portid"])
-                    if portNumber == 8089:
-                        serviceName = 'SPLUNKD'
-                    elif portNumber == 10250:
-                        serviceName = 'KUBERNETES-API'
-                    elif portNumber == 5672:
-                        serviceName = 'RABBITMQ'
-                    elif portNumber == 4040:
-                        serviceName = 'SPARK-WEBUI'
-                    else:
+                    serviceName = PORT_SERVICE_OVERRIDES.get(portNumber)
+                    if serviceName is None:
                         try:
                             serviceName = str(p["service"]["name"]).upper()
                         except KeyError:
@@ -1082,10 +966,7 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
                             "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                             "GeneratorId": distributionArn,
                             "AwsAccountId": awsAccountId,
-                            "Types": [
-                                "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                "TTPs/Discovery"
-                            ],
+                            "Types": ATTACK_SURFACE_FINDING_TYPES,
                             "FirstObservedAt": iso8601Time,
                             "CreatedAt": iso8601Time,
                             "UpdatedAt": iso8601Time,
@@ -1126,26 +1007,7 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
                             ],
                             "Compliance": {
                                 "Status": "FAILED",
-                                "RelatedRequirements": [
-                                    "NIST CSF V1.1 PR.AC-3",
-                                    "NIST SP 800-53 Rev. 4 AC-1",
-                                    "NIST SP 800-53 Rev. 4 AC-17",
-                                    "NIST SP 800-53 Rev. 4 AC-19",
-                                    "NIST SP 800-53 Rev. 4 AC-20",
-                                    "NIST SP 800-53 Rev. 4 SC-15",
-                                    "AICPA TSC CC6.6",
-                                    "ISO 27001:2013 A.6.2.1",
-                                    "ISO 27001:2013 A.6.2.2",
-                                    "ISO 27001:2013 A.11.2.6",
-                                    "ISO 27001:2013 A.13.1.1",
-                                    "ISO 27001:2013 A.13.2.1",
-                                    "MITRE ATT&CK T1040",
-                                    "MITRE ATT&CK T1046",
-                                    "MITRE ATT&CK T1580",
-                                    "MITRE ATT&CK T1590",
-                                    "MITRE ATT&CK T1592",
-                                    "MITRE ATT&CK T1595"
-                                ]
+                                "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                             },
                             "Workflow": {"Status": "NEW"},
                             "RecordState": "ACTIVE"
@@ -1159,10 +1021,7 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
                             "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                             "GeneratorId": distributionArn,
                             "AwsAccountId": awsAccountId,
-                            "Types": [
-                                "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                "TTPs/Discovery"
-                            ],
+                            "Types": ATTACK_SURFACE_FINDING_TYPES,
                             "FirstObservedAt": iso8601Time,
                             "CreatedAt": iso8601Time,
                             "UpdatedAt": iso8601Time,
@@ -1203,26 +1062,7 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
                             ],
                             "Compliance": {
                                 "Status": "PASSED",
-                                "RelatedRequirements": [
-                                    "NIST CSF V1.1 PR.AC-3",
-                                    "NIST SP 800-53 Rev. 4 AC-1",
-                                    "NIST SP 800-53 Rev. 4 AC-17",
-                                    "NIST SP 800-53 Rev. 4 AC-19",
-                                    "NIST SP 800-53 Rev. 4 AC-20",
-                                    "NIST SP 800-53 Rev. 4 SC-15",
-                                    "AICPA TSC CC6.6",
-                                    "ISO 27001:2013 A.6.2.1",
-                                    "ISO 27001:2013 A.6.2.2",
-                                    "ISO 27001:2013 A.11.2.6",
-                                    "ISO 27001:2013 A.13.1.1",
-                                    "ISO 27001:2013 A.13.2.1",
-                                    "MITRE ATT&CK T1040",
-                                    "MITRE ATT&CK T1046",
-                                    "MITRE ATT&CK T1580",
-                                    "MITRE ATT&CK T1590",
-                                    "MITRE ATT&CK T1592",
-                                    "MITRE ATT&CK T1595"
-                                ]
+                                "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                             },
                             "Workflow": {"Status": "RESOLVED"},
                             "RecordState": "ARCHIVED"
@@ -1234,10 +1074,10 @@ def cloudfront_attack_surface_open_tcp_port_check(cache: dict, session, awsAccou
 @registry.register_check("route53")
 def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, awsAccountId: str, awsRegion: str, awsPartition: str) -> dict:
     """[AttackSurface.Route53.{checkIdNumber}] Route53 Public Hosted Zones A Records should not be publicly reachable on {serviceName}"""
-    route53 = session.client("route53")
+    route53 = get_client(cache, session, "route53")
 
     # ISO Time
-    iso8601Time = (datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat())
+    iso8601Time = datetime.datetime.now(datetime.timezone.utc).isoformat()
     for zone in get_public_hosted_zones(cache, session):
         # B64 encode all of the details for the Asset
         assetJson = json.dumps(zone,default=str).encode("utf-8")
@@ -1253,7 +1093,7 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
             else:
                 resourceRecord = str(record["Name"])
                 # Logic time
-                scanner = scan_host(resourceRecord, hzName, "Route53 Public Hosted Zone A Record")
+                scanner = scan_host(cache, resourceRecord, hzName, "Route53 Public Hosted Zone A Record")
                 # NoneType returned on KeyError due to Nmap errors
                 if scanner == None:
                     continue
@@ -1269,15 +1109,8 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
                             # Parse out the Protocol, Port, Service, and State/State Reason from NMAP Results
                             checkIdNumber = str(int(index + 1))
                             portNumber = int(p["portid"])
-                            if portNumber == 8089:
-                                serviceName = 'SPLUNKD'
-                            elif portNumber == 10250:
-                                serviceName = 'KUBERNETES-API'
-                            elif portNumber == 5672:
-                                serviceName = 'RABBITMQ'
-                            elif portNumber == 4040:
-                                serviceName = 'SPARK-WEBUI'
-                            else:
+                            serviceName = PORT_SERVICE_OVERRIDES.get(portNumber)
+                            if serviceName is None:
                                 try:
                                     serviceName = str(p["service"]["name"]).upper()
                                 except KeyError:
@@ -1292,10 +1125,7 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
                                     "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                                     "GeneratorId": f"{hzArn}/{resourceRecord}",
                                     "AwsAccountId": awsAccountId,
-                                    "Types": [
-                                        "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                        "TTPs/Discovery"
-                                    ],
+                                    "Types": ATTACK_SURFACE_FINDING_TYPES,
                                     "FirstObservedAt": iso8601Time,
                                     "CreatedAt": iso8601Time,
                                     "UpdatedAt": iso8601Time,
@@ -1339,26 +1169,7 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
                                     ],
                                     "Compliance": {
                                         "Status": "FAILED",
-                                        "RelatedRequirements": [
-                                            "NIST CSF V1.1 PR.AC-3",
-                                            "NIST SP 800-53 Rev. 4 AC-1",
-                                            "NIST SP 800-53 Rev. 4 AC-17",
-                                            "NIST SP 800-53 Rev. 4 AC-19",
-                                            "NIST SP 800-53 Rev. 4 AC-20",
-                                            "NIST SP 800-53 Rev. 4 SC-15",
-                                            "AICPA TSC CC6.6",
-                                            "ISO 27001:2013 A.6.2.1",
-                                            "ISO 27001:2013 A.6.2.2",
-                                            "ISO 27001:2013 A.11.2.6",
-                                            "ISO 27001:2013 A.13.1.1",
-                                            "ISO 27001:2013 A.13.2.1",
-                                            "MITRE ATT&CK T1040",
-                                            "MITRE ATT&CK T1046",
-                                            "MITRE ATT&CK T1580",
-                                            "MITRE ATT&CK T1590",
-                                            "MITRE ATT&CK T1592",
-                                            "MITRE ATT&CK T1595"
-                                        ]
+                                        "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                                     },
                                     "Workflow": {"Status": "NEW"},
                                     "RecordState": "ACTIVE"
@@ -1372,10 +1183,7 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
                                     "ProductArn": f"arn:{awsPartition}:securityhub:{awsRegion}:{awsAccountId}:product/{awsAccountId}/default",
                                     "GeneratorId": f"{hzArn}/{resourceRecord}",
                                     "AwsAccountId": awsAccountId,
-                                    "Types": [
-                                        "Software and Configuration Checks/AWS Security Best Practices/Network Reachability",
-                                        "TTPs/Discovery"
-                                    ],
+                                    "Types": ATTACK_SURFACE_FINDING_TYPES,
                                     "FirstObservedAt": iso8601Time,
                                     "CreatedAt": iso8601Time,
                                     "UpdatedAt": iso8601Time,
@@ -1419,26 +1227,7 @@ def route53_public_hz_attack_surface_open_tcp_port_check(cache: dict, session, a
                                     ],
                                     "Compliance": {
                                         "Status": "PASSED",
-                                        "RelatedRequirements": [
-                                            "NIST CSF V1.1 PR.AC-3",
-                                            "NIST SP 800-53 Rev. 4 AC-1",
-                                            "NIST SP 800-53 Rev. 4 AC-17",
-                                            "NIST SP 800-53 Rev. 4 AC-19",
-                                            "NIST SP 800-53 Rev. 4 AC-20",
-                                            "NIST SP 800-53 Rev. 4 SC-15",
-                                            "AICPA TSC CC6.6",
-                                            "ISO 27001:2013 A.6.2.1",
-                                            "ISO 27001:2013 A.6.2.2",
-                                            "ISO 27001:2013 A.11.2.6",
-                                            "ISO 27001:2013 A.13.1.1",
-                                            "ISO 27001:2013 A.13.2.1",
-                                            "MITRE ATT&CK T1040",
-                                            "MITRE ATT&CK T1046",
-                                            "MITRE ATT&CK T1580",
-                                            "MITRE ATT&CK T1590",
-                                            "MITRE ATT&CK T1592",
-                                            "MITRE ATT&CK T1595"
-                                        ]
+                                        "RelatedRequirements": list(ATTACK_SURFACE_RELATED_REQUIREMENTS)
                                     },
                                     "Workflow": {"Status": "RESOLVED"},
                                     "RecordState": "ARCHIVED"
@@ -0,0 +1,146 @@
+#This file is part of ElectricEye.
+#SPDX-License-Identifier: Apache-2.0
+
+#Licensed to the Apache Software Foundation (ASF) under one
+#or more contributor license agreements.  See the NOTICE file
+#distributed with this work for additional information
+#regarding copyright ownership.  The ASF licenses this file
+#to you under the Apache License, Version 2.0 (the
+#"License"); you may not use this file except in compliance
+#with the License.  You may obtain a copy of the License at
+
+#http://www.apache.org/licenses/LICENSE-2.0
+
+#Unless required by applicable law or agreed to in writing,
+#software distributed under the License is distributed on an
+#"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+#KIND, either express or implied.  See the License for the
+#specific language governing permissions and limitations
+#under the License.
+import boto3
+import pytest
+
+from botocore.stub import Stubber
+
+from . import context
+from auditors.aws.Amazon_DAX_Auditor import (
+    dax_encryption_at_rest_check,
+    dax_cache_ttl_check
+)
+
+def dax_cluster(sseStatus=None):
+    cluster = {
+        "ClusterName": "dax-cluster",
+        "ClusterArn": "arn:aws:dax:us-east-1:012345678901:cache/dax-cluster",
+        "TotalNodes": 1,
+        "NodeType": "dax.t3.small",
+        "Status": "available",
+        "ClusterDiscoveryEndpoint": {
+            "Address": "dax-cluster.abc123.dax-clusters.us-east-1.amazonaws.com",
+            "Port": 8111,
+            "URL": "dax://dax-cluster.abc123.dax-clusters.us-east-1.amazonaws.com"
+        },
+        "SubnetGroup": "default",
+        "SecurityGroups": [
+            {
+                "SecurityGroupIdentifier": "sg-12345678",
+                "Status": "active"
+            }
+        ],
+        "IamRoleArn": "arn:aws:iam::012345678901:role/dax-role",
+        "ParameterGroup": {
+            "ParameterGroupName": "default.dax1.0",
+            "ParameterApplyStatus": "in-sync"
+        },
+        "ClusterEndpointEncryptionType": "TLS"
+    }
+    if sseStatus:
+        cluster["SSEDescription"] = {"Status": sseStatus}
+    return cluster
+
+describe_clusters_response_disabling = {
+    "Clusters": [dax_cluster("DISABLING")]
+}
+
+# older clusters may not return an SSEDescription at all
+describe_clusters_response_no_sse = {
+    "Clusters": [dax_cluster()]
+}
+
+describe_clusters_response_enabled = {
+    "Clusters": [dax_cluster("ENABLED")]
+}
+
+# record-ttl-millis is only returned on the second page of parameters
+describe_parameters_response_page1 = {
+    "NextToken": "page2",
+    "Parameters": [
+        {
+            "ParameterName": "query-ttl-millis",
+            "ParameterValue": "300000"
+        }
+    ]
+}
+
+describe_parameters_response_page2 = {
+    "Parameters": [
+        {
+            "ParameterName": "record-ttl-millis",
+            "ParameterValue": "0"
+        }
+    ]
+}
+
+@pytest.fixture(scope="function")
+def dax_stubber():
+    dax = boto3.client("dax", region_name="us-east-1")
+    dax_stubber = Stubber(dax)
+    dax_stubber.activate()
+    yield dax_stubber
+    dax_stubber.deactivate()
+
+
+def test_encryption_at_rest_disabling_check(dax_stubber):
+    dax_stubber.add_response("describe_clusters", describe_clusters_response_disabling)
+    results = list(dax_encryption_at_rest_check(
+        cache={"dax_client": dax_stubber.client}, session=None, awsAccountId="012345678901", awsRegion="us-east-1", awsPartition="aws"
+    ))
+    assert len(results) == 1
+    for result in results:
+        assert result["Compliance"]["Status"] == "FAILED"
+        assert result["RecordState"] == "ACTIVE"
+    dax_stubber.assert_no_pending_responses()
+
+
+def test_encryption_at_rest_no_sse_description_check(dax_stubber):
+    dax_stubber.add_response("describe_clusters", describe_clusters_response_no_sse)
+    results = list(dax_encryption_at_rest_check(
+        cache={"dax_client": dax_stubber.client}, session=None, awsAccountId="012345678901", awsRegion="us-east-1", awsPartition="aws"
+    ))
+    assert len(results) == 1
+    for result in results:
+        assert result["Compliance"]["Status"] == "FAILED"
+        assert result["RecordState"] == "ACTIVE"
+    dax_stubber.assert_no_pending_responses()
+
+
+def test_cache_ttl_later_page_check(dax_stubber):
+    dax_stubber.add_response("describe_clusters", describe_clusters_response_enabled)
+    dax_stubber.add_response(
+        "describe_parameters",
+        describe_parameters_response_page1,
+        {"ParameterGroupName": "default.dax1.0"}
+    )
+    dax_stubber.add_response(
+        "describe_parameters",
+        describe_parameters_response_page2,
+        {"ParameterGroupName": "default.dax1.0", "NextToken": "page2"}
+    )
+    results = list(dax_cache_ttl_check(
+        cache={"dax_client": dax_stubber.client}, session=None, awsAccountId="012345678901", awsRegion="us-east-1", awsPartition="aws"
+    ))
+    assert len(results) == 1
+    for result in results:
+        assert result["Compliance"]["Status"] == "FAILED"
+        assert result["RecordState"] == "ACTIVE"
+    dax_stubber.assert_no_pending_responses()